@@ -8,29 +8,47 @@ for AI agents with full observability through Cequence AI Gateway.
 Requirements:
 - fastapi
 - uvicorn
+- gunicorn
+- uvloop
+- httptools
 - python-jose[cryptography]
 - requests
 - python-multipart
 - aiofiles
-- httpx
+- httpx[http2]
 - pydantic
 - python-dotenv
+- cachetools
+- orjson
+- redis[hiredis]
+- msgpack
 """
 
 import os
-import json
+import time
+import heapq
 import asyncio
+import hashlib
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from functools import cached_property
+from typing import Annotated, Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Type, Union
 from pathlib import Path
 
 import httpx
+import msgpack
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Depends, Security, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, OAuth2PasswordBearer
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from jose import JWTError, jwt
 import uvicorn
 
@@ -49,14 +67,35 @@ class Config:
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key")
     JWT_ALGORITHM = "HS256"
     JWT_EXPIRATION_HOURS = 24
+    DESCOPE_JWKS_URL = os.getenv("DESCOPE_JWKS_URL", f"https://api.descope.com/v2/keys/{DESCOPE_PROJECT_ID}")
+    DESCOPE_JWT_ALGORITHM = "RS256"
+    JWKS_REFRESH_SECONDS = int(os.getenv("JWKS_REFRESH_SECONDS", "600"))
+    JWKS_MIN_REFRESH_SECONDS = int(os.getenv("JWKS_MIN_REFRESH_SECONDS", "30"))
+    
+    # Verified token cache (entries never outlive the token's own exp)
+    TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", "10000"))
+    TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "30"))
+    
+    # Shared (cross-worker) verified token cache; disabled when REDIS_URL is unset
+    REDIS_URL = os.getenv("REDIS_URL")
+    REDIS_TOKEN_KEY_PREFIX = b"mcp:token:"
+    REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "0.1"))
+    REDIS_CONNECT_TIMEOUT_SECONDS = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", "0.2"))
+    # After a Redis error the shared cache is bypassed for this long
+    REDIS_RETRY_SECONDS = float(os.getenv("REDIS_RETRY_SECONDS", "5"))
     
     # Cequence AI Gateway Configuration
     CEQUENCE_GATEWAY_URL = os.getenv("CEQUENCE_GATEWAY_URL", "https://your-gateway.cequence.ai")
     CEQUENCE_API_KEY = os.getenv("CEQUENCE_API_KEY", "your_cequence_api_key")
+    CEQUENCE_BATCH_SIZE = int(os.getenv("CEQUENCE_BATCH_SIZE", "100"))
+    CEQUENCE_FLUSH_INTERVAL_MS = int(os.getenv("CEQUENCE_FLUSH_INTERVAL_MS", "200"))
+    CEQUENCE_QUEUE_MAXSIZE = int(os.getenv("CEQUENCE_QUEUE_MAXSIZE", "10000"))
     
     # MCP Server Configuration
     MCP_SERVER_NAME = "workplace-search"
     MCP_SERVER_VERSION = "1.0.0"
+    ENV = os.getenv("ENV", "dev")
+    IS_PRODUCTION = ENV == "prod"
     
     # Security
     ALLOWED_ORIGINS = ["https://claude.ai", "https://desktop.claude.ai", "http://localhost:3000"]
@@ -65,6 +104,9 @@ class Config:
 config = Config()
 
 # Pydantic Models
+# Inbound models skip default validation and silently ignore unknown fields
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", validate_default=False, str_strip_whitespace=False)
+
 class MCPTool(BaseModel):
     """MCP Tool Definition"""
     name: str
@@ -73,6 +115,8 @@ class MCPTool(BaseModel):
 
 class MCPToolCall(BaseModel):
     """MCP Tool Call Request"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     name: str
     arguments: Dict[str, Any]
 
@@ -83,6 +127,8 @@ class MCPResponse(BaseModel):
 
 class WorkplaceSearchRequest(BaseModel):
     """Workplace Search Request"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     query: str = Field(..., description="Search query")
     sources: List[str] = Field(default=["google_drive", "notion"], description="Sources to search")
     max_results: int = Field(default=10, ge=1, le=50, description="Maximum number of results")
@@ -108,22 +154,89 @@ class WorkplaceSearchResponse(BaseModel):
 
 class UserClaims(BaseModel):
     """JWT User Claims"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     user_id: str
     email: str
     scopes: List[str]
     exp: int
+    
+    @computed_field
+    @cached_property
+    def scopes_set(self) -> FrozenSet[str]:
+        """Scopes as a set for O(1) membership checks"""
+        return frozenset(self.scopes)
+    
+    @computed_field
+    @cached_property
+    def scope_prefixes(self) -> FrozenSet[str]:
+        """Every colon-delimited prefix of every scope, e.g. workplace, workplace:read"""
+        prefixes = set()
+        for scope in self.scopes:
+            parts = scope.split(":")
+            for i in range(1, len(parts) + 1):
+                prefixes.add(":".join(parts[:i]))
+        return frozenset(prefixes)
+    
+    @computed_field
+    @cached_property
+    def workplace_read(self) -> bool:
+        """Whether the user holds workplace:read or any workplace:read:* scope"""
+        return "workplace:read" in self.scope_prefixes
 
 # Security
 security = HTTPBearer()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Shared clients for Descope and Redis, created and closed by the app lifespan
+descope_client: Optional[httpx.AsyncClient] = None
+redis_client: Optional[aioredis.Redis] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage long-lived outbound HTTP clients and background tasks"""
+    global descope_client, redis_client
+    descope_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=50,
+            max_connections=200,
+            keepalive_expiry=30.0
+        ),
+        timeout=10.0
+    )
+    if config.REDIS_URL:
+        redis_client = aioredis.from_url(
+            config.REDIS_URL,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=config.REDIS_CONNECT_TIMEOUT_SECONDS
+        )
+    try:
+        await jwks_cache.refresh()
+    except Exception as e:
+        logger.error(f"Initial Descope JWKS fetch failed: {e}")
+    jwks_cache.start()
+    cequence_client.start()
+    try:
+        yield
+    finally:
+        await jwks_cache.stop()
+        await descope_client.aclose()
+        await cequence_client.aclose()
+        if redis_client is not None:
+            await redis_client.aclose()
+
 # FastAPI App
 app = FastAPI(
     title="MCP Workplace Search Server",
     description="Production-ready MCP server with Cequence AI Gateway integration",
     version=config.MCP_SERVER_VERSION,
-    docs_url="/docs",
-    redoc_url="/redoc"
+    default_response_class=ORJSONResponse,
+    # No interactive docs or OpenAPI schema generation in production
+    docs_url=None if config.IS_PRODUCTION else "/docs",
+    redoc_url=None if config.IS_PRODUCTION else "/redoc",
+    openapi_url=None if config.IS_PRODUCTION else "/openapi.json",
+    lifespan=lifespan
 )
 
 # Middleware
@@ -141,34 +254,174 @@ app.add_middleware(
 )
 
 # Authentication Functions
+_token_cache: TTLCache = TTLCache(
+    maxsize=config.TOKEN_CACHE_MAXSIZE,
+    ttl=config.TOKEN_CACHE_TTL_SECONDS
+)
+
+class JWKSCache:
+    """Descope public signing keys, fetched once and refreshed periodically"""
+    
+    def __init__(self, url: str, refresh_seconds: int):
+        self.url = url
+        self.refresh_seconds = refresh_seconds
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._last_refresh = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+    
+    async def refresh(self):
+        """Fetch the JWKS and replace the cached keys"""
+        # Recorded before the fetch so a failing endpoint is not hammered
+        self._last_refresh = time.monotonic()
+        response = await descope_client.get(self.url)
+        response.raise_for_status()
+        self._keys = {
+            key["kid"]: key for key in response.json().get("keys", []) if "kid" in key
+        }
+    
+    async def _refresh_loop(self):
+        """Refresh the keys every refresh_seconds"""
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Descope JWKS refresh failed: {e}")
+    
+    def start(self):
+        """Start periodic background refreshes"""
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop())
+    
+    async def stop(self):
+        """Stop periodic background refreshes"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+    
+    async def get_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a signing key, refreshing once (rate limited) on an unknown kid"""
+        key = self._keys.get(kid)
+        if key is not None or not kid:
+            return key
+        async with self._refresh_lock:
+            key = self._keys.get(kid)
+            if key is None and time.monotonic() - self._last_refresh >= config.JWKS_MIN_REFRESH_SECONDS:
+                await self.refresh()
+                key = self._keys.get(kid)
+        return key
+
+jwks_cache = JWKSCache(config.DESCOPE_JWKS_URL, config.JWKS_REFRESH_SECONDS)
+
+# Circuit breaker: monotonic time before which Redis is not retried
+_redis_retry_at = 0.0
+
+def _redis_available() -> bool:
+    """Whether the shared cache is configured and not tripped by a recent error"""
+    return redis_client is not None and time.monotonic() >= _redis_retry_at
+
+def _redis_failed(action: str, error: Exception):
+    """Trip the breaker so a Redis outage logs once per retry window, not per request"""
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + config.REDIS_RETRY_SECONDS
+    logger.error(
+        f"Redis token cache {action} failed, bypassing for {config.REDIS_RETRY_SECONDS}s: {error}"
+    )
+
+async def _get_shared_claims(cache_key: bytes) -> Optional[UserClaims]:
+    """Look up verified claims in the shared Redis cache"""
+    if not _redis_available():
+        return None
+    try:
+        blob = await redis_client.get(config.REDIS_TOKEN_KEY_PREFIX + cache_key)
+    except RedisError as e:
+        _redis_failed("lookup", e)
+        return None
+    if blob is None:
+        return None
+    try:
+        user_id, email, scopes, exp = msgpack.unpackb(blob)
+        if exp <= time.time():
+            return None
+        return UserClaims.model_validate({
+            "user_id": user_id,
+            "email": email,
+            "scopes": scopes,
+            "exp": exp
+        })
+    except (msgpack.UnpackException, ValueError, TypeError):
+        # Corrupt or foreign value under our prefix: treat as a miss
+        return None
+
+async def _set_shared_claims(cache_key: bytes, claims: UserClaims):
+    """Store verified claims in the shared Redis cache until the token expires"""
+    if not _redis_available():
+        return
+    ttl = int(claims.exp - time.time())
+    if ttl <= 0:
+        return
+    blob = msgpack.packb([claims.user_id, claims.email, claims.scopes, claims.exp])
+    try:
+        await redis_client.set(config.REDIS_TOKEN_KEY_PREFIX + cache_key, blob, ex=ttl)
+    except RedisError as e:
+        _redis_failed("store", e)
+
 async def verify_descope_token(token: str) -> UserClaims:
     """Verify Descope JWT token"""
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        if cached.exp > time.time():
+            return cached
+        _token_cache.pop(cache_key, None)
+    
+    # L2: claims verified by any worker
+    shared = await _get_shared_claims(cache_key)
+    if shared is not None:
+        _token_cache[cache_key] = shared
+        return shared
+    
     try:
-        # In production, get Descope public key and verify signature
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{config.DESCOPE_DOMAIN}/keys",
-                headers={"Authorization": f"Bearer {token}"}
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") == config.JWT_ALGORITHM:
+            # Internal token issued by /auth/token/exchange
+            payload = jwt.decode(
+                token, 
+                config.JWT_SECRET_KEY, 
+                algorithms=[config.JWT_ALGORITHM]
             )
-            if response.status_code != 200:
+        else:
+            # Descope token, verified locally against the cached JWKS
+            key = await jwks_cache.get_key(header.get("kid"))
+            if key is None:
                 raise HTTPException(status_code=401, detail="Invalid token")
+            payload = jwt.decode(
+                token, 
+                key, 
+                algorithms=[config.DESCOPE_JWT_ALGORITHM],
+                audience=config.DESCOPE_PROJECT_ID
+            )
         
-        # Decode JWT (simplified - in production, verify with Descope public key)
-        payload = jwt.decode(
-            token, 
-            config.JWT_SECRET_KEY, 
-            algorithms=[config.JWT_ALGORITHM]
-        )
-        
-        return UserClaims(
-            user_id=payload.get("sub"),
-            email=payload.get("email"),
-            scopes=payload.get("permissions", []),
-            exp=payload.get("exp")
-        )
+        claims = UserClaims.model_validate({
+            "user_id": payload.get("sub"),
+            "email": payload.get("email"),
+            "scopes": payload.get("permissions", []),
+            "exp": payload.get("exp")
+        })
     except JWTError as e:
         logger.error(f"JWT verification failed: {e}")
         raise HTTPException(status_code=401, detail="Invalid token")
+    
+    # Only successful verifications are cached, and never past the token's exp
+    if claims.exp > time.time():
+        _token_cache[cache_key] = claims
+        await _set_shared_claims(cache_key, claims)
+    return claims
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Security(security)) -> UserClaims:
     """Get current authenticated user"""
@@ -180,68 +433,174 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Security(
         logger.error(f"Authentication error: {e}")
         raise HTTPException(status_code=401, detail="Authentication failed")
 
-async def check_scope(required_scope: str, user: UserClaims = Depends(get_current_user)) -> UserClaims:
-    """Check if user has required scope"""
-    if required_scope not in user.scopes:
-        raise HTTPException(
-            status_code=403, 
-            detail=f"Insufficient permissions. Required scope: {required_scope}"
-        )
-    return user
+def require_scope(required_scope: str) -> Callable[..., Awaitable[UserClaims]]:
+    """Build a dependency that requires the user to hold a scope or any scope under it"""
+    async def check_scope(user: Annotated[UserClaims, Depends(get_current_user)]) -> UserClaims:
+        # Same prefix rule as call_tool, e.g. workplace:read:notion satisfies workplace:read
+        if required_scope not in user.scope_prefixes:
+            raise HTTPException(
+                status_code=403, 
+                detail=f"Insufficient permissions. Required scope: {required_scope}:*"
+            )
+        return user
+    return check_scope
 
 # Cequence AI Gateway Integration
 class CequenceClient:
-    """Cequence AI Gateway Client"""
+    """Cequence AI Gateway Client
+    
+    Log events are queued in-process and shipped in batches by a background
+    flusher, so tool calls never wait on the gateway.
+    """
     
     def __init__(self):
         self.base_url = config.CEQUENCE_GATEWAY_URL
         self.api_key = config.CEQUENCE_API_KEY
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client: Optional[httpx.AsyncClient] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._clock: Optional[asyncio.Task] = None
+        self._dropped_events = 0
+        # Event timestamp, refreshed in the background instead of formatted per event
+        self._now_iso = datetime.utcnow().isoformat(timespec="seconds")
     
-    async def log_request(self, user_id: str, tool_name: str, request_data: Dict[str, Any]):
-        """Log request to Cequence for observability"""
-        try:
-            await self.client.post(
-                f"{self.base_url}/api/v1/mcp/requests",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "user_id": user_id,
-                    "tool_name": tool_name,
-                    "request_data": request_data,
-                    "server_name": config.MCP_SERVER_NAME,
-                    "server_version": config.MCP_SERVER_VERSION
-                }
+    def start(self):
+        """Open the HTTP connection pool and start the batch flusher and timestamp clock"""
+        # Created here, not at import, so the queue binds to the running loop
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=config.CEQUENCE_QUEUE_MAXSIZE)
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0
+                )
             )
-        except Exception as e:
-            logger.error(f"Failed to log request to Cequence: {e}")
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+        if self._clock is None:
+            self._clock = asyncio.create_task(self._clock_loop())
     
-    async def log_response(self, user_id: str, tool_name: str, response_data: Dict[str, Any], 
-                          execution_time_ms: int, success: bool):
-        """Log response to Cequence for observability"""
+    async def aclose(self):
+        """Flush pending events and close the underlying HTTP connection pool"""
+        for task in (self._clock, self._flusher):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._clock = self._flusher = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                await self._send_batch(self._drain(config.CEQUENCE_BATCH_SIZE))
+            self._queue = None
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    def _enqueue(self, event: Dict[str, Any]):
+        """Queue an event, dropping it if the queue is full or not started"""
+        if self._queue is None:
+            self._dropped_events += 1
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._dropped_events += 1
+    
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """Take up to `limit` queued events without waiting"""
+        batch = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+    
+    async def _clock_loop(self):
+        """Refresh the cached event timestamp twice a second"""
+        while True:
+            self._now_iso = datetime.utcnow().isoformat(timespec="seconds")
+            await asyncio.sleep(0.5)
+    
+    async def _flush_loop(self):
+        """Ship up to CEQUENCE_BATCH_SIZE events per POST, at most every flush interval"""
+        loop = asyncio.get_running_loop()
+        interval = config.CEQUENCE_FLUSH_INTERVAL_MS / 1000
+        batch: List[Dict[str, Any]] = []
+        sending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + interval
+                while len(batch) < config.CEQUENCE_BATCH_SIZE:
+                    batch.extend(self._drain(config.CEQUENCE_BATCH_SIZE - len(batch)))
+                    remaining = deadline - loop.time()
+                    if len(batch) >= config.CEQUENCE_BATCH_SIZE or remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                events, batch = batch, []
+                # Shielded so cancellation on shutdown can't abort the POST mid-flight
+                sending = asyncio.ensure_future(self._send_batch(events))
+                await asyncio.shield(sending)
+                sending = None
+        except asyncio.CancelledError:
+            # Let an in-flight POST finish and don't lose a partially collected batch
+            if sending is not None:
+                await sending
+            if batch:
+                await self._send_batch(batch)
+            raise
+    
+    async def _send_batch(self, events: List[Dict[str, Any]]):
+        """POST a batch of events to Cequence"""
+        if self._dropped_events:
+            logger.warning(f"Dropped {self._dropped_events} Cequence events: queue full")
+            self._dropped_events = 0
+        if not events:
+            return
         try:
             await self.client.post(
-                f"{self.base_url}/api/v1/mcp/responses",
+                f"{self.base_url}/api/v1/mcp/batch",
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
-                json={
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "user_id": user_id,
-                    "tool_name": tool_name,
-                    "response_data": response_data,
-                    "execution_time_ms": execution_time_ms,
-                    "success": success,
-                    "server_name": config.MCP_SERVER_NAME,
-                    "server_version": config.MCP_SERVER_VERSION
-                }
+                content=orjson.dumps({"events": events})
             )
         except Exception as e:
-            logger.error(f"Failed to log response to Cequence: {e}")
+            logger.error(f"Failed to send {len(events)} events to Cequence: {e}")
+    
+    def log_request(self, user_id: str, tool_name: str, request_data: Dict[str, Any]):
+        """Log request to Cequence for observability"""
+        self._enqueue({
+            "event_type": "request",
+            "timestamp": self._now_iso,
+            "user_id": user_id,
+            "tool_name": tool_name,
+            "request_data": request_data,
+            "server_name": config.MCP_SERVER_NAME,
+            "server_version": config.MCP_SERVER_VERSION
+        })
+    
+    def log_response(self, user_id: str, tool_name: str, response_data: Dict[str, Any], 
+                     execution_time_ms: int, success: bool):
+        """Log response to Cequence for observability"""
+        self._enqueue({
+            "event_type": "response",
+            "timestamp": self._now_iso,
+            "user_id": user_id,
+            "tool_name": tool_name,
+            "response_data": response_data,
+            "execution_time_ms": execution_time_ms,
+            "success": success,
+            "server_name": config.MCP_SERVER_NAME,
+            "server_version": config.MCP_SERVER_VERSION
+        })
 
 cequence_client = CequenceClient()
 
@@ -283,7 +642,7 @@ class WorkplaceSearchService:
     
     async def search(self, request: WorkplaceSearchRequest, user: UserClaims) -> WorkplaceSearchResponse:
         """Perform workplace search across multiple sources"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         all_results = []
         
         # Mock user OAuth tokens - in production, retrieve from secure storage
@@ -292,39 +651,42 @@ class WorkplaceSearchService:
             "notion": "mock_notion_token"
         }
         
+        source_search = {
+            "google_drive": self.search_google_drive,
+            "notion": self.search_notion
+        }
+        
+        # Query every authorized source concurrently
+        searched_sources = []
+        tasks = []
         for source in request.sources:
-            try:
-                if source == "google_drive" and "workplace:read:google_drive" in user.scopes:
-                    results = await self.search_google_drive(
-                        request.query, 
-                        user_tokens.get("google_drive"), 
-                        request.max_results
-                    )
-                    all_results.extend(results)
-                
-                elif source == "notion" and "workplace:read:notion" in user.scopes:
-                    results = await self.search_notion(
-                        request.query, 
-                        user_tokens.get("notion"), 
-                        request.max_results
-                    )
-                    all_results.extend(results)
-                    
-            except Exception as e:
-                logger.error(f"Error searching {source}: {e}")
+            search_fn = source_search.get(source)
+            if search_fn and f"workplace:read:{source}" in user.scopes_set:
+                searched_sources.append(source)
+                tasks.append(search_fn(
+                    request.query,
+                    user_tokens.get(source),
+                    request.max_results
+                ))
+        
+        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
+        for source, results in zip(searched_sources, results_lists):
+            if isinstance(results, BaseException):
+                logger.error(f"Error searching {source}: {results}")
+                continue
+            all_results.extend(results)
         
         # Sort by score and limit results
-        all_results.sort(key=lambda x: x.score, reverse=True)
-        final_results = all_results[:request.max_results]
+        final_results = heapq.nlargest(request.max_results, all_results, key=lambda x: x.score)
         
-        execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         return WorkplaceSearchResponse(
             results=final_results,
             total_count=len(final_results),
             query=request.query,
             sources=request.sources,
-            execution_time_ms=int(execution_time)
+            execution_time_ms=execution_time
         )
 
 workplace_search = WorkplaceSearchService()
@@ -365,6 +727,45 @@ MCP_TOOLS = [
     )
 ]
 
+# MCP Tool Dispatch
+@dataclass(frozen=True)
+class ToolHandler:
+    """Dispatch entry for an MCP tool"""
+    request_model: Type[BaseModel]
+    required_scope_prefix: str
+    execute: Callable[[Any, UserClaims], Awaitable[BaseModel]]
+    render: Callable[[Any, str], List[Dict[str, Any]]]
+
+def render_workplace_search(search_response: WorkplaceSearchResponse, resp_json: str) -> List[Dict[str, Any]]:
+    """Format workplace search results as MCP content"""
+    return [{
+        "type": "text",
+        "text": f"Found {search_response.total_count} results for '{search_response.query}'"
+    }, {
+        "type": "resource",
+        "resource": {
+            "uri": f"workplace://search/{search_response.query}",
+            "name": "Search Results",
+            "mimeType": "application/json",
+            "text": resp_json
+        }
+    }]
+
+TOOL_REGISTRY: Dict[str, ToolHandler] = {
+    "workplace_search": ToolHandler(
+        request_model=WorkplaceSearchRequest,
+        required_scope_prefix="workplace:read",
+        execute=workplace_search.search,
+        render=render_workplace_search
+    )
+}
+
+# MCP_TOOLS is static, so the /mcp/tools bodies are serialized once at import
+_TOOLS_JSON_WITH_WS = orjson.dumps(
+    [tool.model_dump() for tool in MCP_TOOLS if tool.name == "workplace_search"]
+)
+_TOOLS_JSON_EMPTY = orjson.dumps([])
+
 # API Endpoints
 
 @app.get("/health")
@@ -390,16 +791,15 @@ async def mcp_info():
 async def list_tools(user: UserClaims = Depends(get_current_user)):
     """List available MCP tools"""
     # Filter tools based on user permissions
-    available_tools = []
-    for tool in MCP_TOOLS:
-        if tool.name == "workplace_search":
-            # Check if user has any workplace read permissions
-            if any(scope.startswith("workplace:read:") for scope in user.scopes):
-                available_tools.append(tool)
-    
-    return available_tools
-
-@app.post("/mcp/tools/{tool_name}/call", response_model=MCPResponse)
+    body = _TOOLS_JSON_WITH_WS if user.workplace_read else _TOOLS_JSON_EMPTY
+    return Response(content=body, media_type="application/json")
+
+# Built as a raw ORJSONResponse; MCPResponse only documents the schema
+@app.post(
+    "/mcp/tools/{tool_name}/call",
+    response_model=None,
+    responses={200: {"model": MCPResponse}}
+)
 async def call_tool(
     tool_name: str,
     tool_call: MCPToolCall,
@@ -407,65 +807,56 @@ async def call_tool(
     user: UserClaims = Depends(get_current_user)
 ):
     """Execute MCP tool call"""
-    start_time = datetime.utcnow()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Log request to Cequence
-        await cequence_client.log_request(
+        cequence_client.log_request(
             user.user_id, 
             tool_name, 
             {"arguments": tool_call.arguments}
         )
         
-        if tool_name == "workplace_search":
-            # Validate user has required permissions
-            required_scope = "workplace:read"
-            if not any(scope.startswith(required_scope) for scope in user.scopes):
-                raise HTTPException(
-                    status_code=403, 
-                    detail=f"Insufficient permissions. Required scope: {required_scope}:*"
-                )
-            
-            # Execute workplace search
-            search_request = WorkplaceSearchRequest(**tool_call.arguments)
-            search_response = await workplace_search.search(search_request, user)
-            
-            execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            
-            # Log successful response to Cequence
-            await cequence_client.log_response(
-                user.user_id, 
-                tool_name, 
-                search_response.dict(), 
-                execution_time, 
-                True
-            )
-            
-            return MCPResponse(
-                content=[{
-                    "type": "text",
-                    "text": f"Found {search_response.total_count} results for '{search_response.query}'"
-                }, {
-                    "type": "resource",
-                    "resource": {
-                        "uri": f"workplace://search/{search_response.query}",
-                        "name": "Search Results",
-                        "mimeType": "application/json",
-                        "text": json.dumps(search_response.dict(), indent=2)
-                    }
-                }]
+        handler = TOOL_REGISTRY.get(tool_name)
+        if handler is None:
+            raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+        
+        # Validate user has required permissions
+        if handler.required_scope_prefix not in user.scope_prefixes:
+            raise HTTPException(
+                status_code=403, 
+                detail=f"Insufficient permissions. Required scope: {handler.required_scope_prefix}:*"
             )
         
-        else:
-            raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+        # Execute tool
+        tool_request = handler.request_model.model_validate(tool_call.arguments)
+        tool_response = await handler.execute(tool_request, user)
+        resp_dict = tool_response.model_dump(mode="json")
+        resp_json = orjson.dumps(resp_dict).decode()
+        
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        
+        # Log successful response to Cequence
+        cequence_client.log_response(
+            user.user_id, 
+            tool_name, 
+            resp_dict, 
+            execution_time, 
+            True
+        )
+        
+        return ORJSONResponse({
+            "content": handler.render(tool_response, resp_json),
+            "isError": False
+        })
     
     except HTTPException:
-        execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        await cequence_client.log_response(user.user_id, tool_name, {}, execution_time, False)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        cequence_client.log_response(user.user_id, tool_name, {}, execution_time, False)
         raise
     except Exception as e:
-        execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        await cequence_client.log_response(user.user_id, tool_name, {}, execution_time, False)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        cequence_client.log_response(user.user_id, tool_name, {}, execution_time, False)
         logger.error(f"Tool execution error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -474,7 +865,7 @@ async def call_tool(
 @app.post("/api/v1/workplace/search", response_model=WorkplaceSearchResponse)
 async def workplace_search_endpoint(
     search_request: WorkplaceSearchRequest,
-    user: UserClaims = Depends(lambda: check_scope("workplace:read"))
+    user: Annotated[UserClaims, Depends(require_scope("workplace:read"))]
 ):
     """Direct workplace search API endpoint"""
     return await workplace_search.search(search_request, user)
@@ -514,12 +905,25 @@ async def exchange_descope_token(descope_token: str):
         raise HTTPException(status_code=401, detail="Token exchange failed")
 
 if __name__ == "__main__":
-    # Production deployment with proper SSL
-    uvicorn.run(
-        app,
-        host="0.0.0.0",
-        port=8000,
-        ssl_keyfile="path/to/private.key",
-        ssl_certfile="path/to/certificate.crt",
-        log_level="info"
-    )
\ No newline at end of file
+    if os.getenv("DEV"):
+        # Local development: single uvicorn process
+        uvicorn.run(
+            "mcp:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            log_level="warning"
+        )
+    else:
+        # Production: gunicorn supervises 2N+1 uvicorn workers (uvloop/httptools
+        # are picked up automatically by UvicornWorker when installed)
+        workers = 2 * (os.cpu_count() or 1) + 1
+        os.execvp("gunicorn", [
+            "gunicorn", "mcp:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(workers),
+            "--bind", "0.0.0.0:8000",
+            "--keep-alive", "30",
+            "--access-logfile", "-"
+        ])
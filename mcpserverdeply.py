@@ -11,6 +11,9 @@
 #     ports:
 #       - "8000:8000"
 #     environment:
+#       - ENV=prod
+#       - REDIS_URL=redis://redis:6379/0
+      
 #       # Descope OAuth Configuration
 #       - DESCOPE_PROJECT_ID=${DESCOPE_PROJECT_ID}
 #       - JWT_SECRET_KEY=${JWT_SECRET_KEY}
@@ -109,20 +112,26 @@
 
 # EXPOSE 8000
 
-# CMD ["python", "mcp_server.py"]
+# CMD ["gunicorn", "mcp:app", "-k", "uvicorn.workers.UvicornWorker", "-w", "9", "--bind", "0.0.0.0:8000", "--keep-alive", "30", "--access-logfile", "-"]
 
 # ---
 # # requirements.txt - Python dependencies
 # fastapi==0.104.1
 # uvicorn[standard]==0.24.0
+# gunicorn==21.2.0
+# uvloop==0.19.0
+# httptools==0.6.1
 # python-jose[cryptography]==3.3.0
 # requests==2.31.0
 # python-multipart==0.0.6
 # aiofiles==23.2.1
-# httpx==0.25.2
+# httpx[http2]==0.25.2
 # pydantic==2.5.0
 # python-dotenv==1.0.0
-# redis==5.0.1
+# redis[hiredis]==5.0.1
+# msgpack==1.0.7
+# cachetools==5.3.2
+# orjson==3.9.10
 # google-api-python-client==2.108.0
 # notion-client==2.2.1
 # cryptography==41.0.7